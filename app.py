@@ -1,54 +1,215 @@
 # app.py
 
 import os
-from flask import Flask, jsonify, request, send_from_directory, abort, send_file  
+import functools
+import gzip
+import html
+import json
+import mimetypes
+from flask import Flask, Response, g, jsonify, request, send_from_directory, abort, stream_with_context
+from werkzeug.http import dump_options_header
 import datetime
 import logging
+import logging.handlers
 import atexit
+import calendar
+import queue
 import re
-import shutil
+import shlex
+import threading
+import time
+import unicodedata
+import zlib
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from config import BULLETINS, SUCCESS_KEYWORDS, ERROR_KEYWORDS, WARNING_KEYWORDS, CRITICAL_KEYWORDS, LOG_LINES_TO_FETCH  
-from ssh_utils import BQRMSshClient  
+from config import BULLETINS, BULLETINS_BY_ID, SUCCESS_KEYWORDS, ERROR_KEYWORDS, WARNING_KEYWORDS, CRITICAL_KEYWORDS, LOG_LINES_TO_FETCH  
+from ssh_utils import BQRMSshPool, SshConnectionLost, SshPoolExhausted  
 
 app = Flask(__name__, static_folder='static')
+# Responses are compact and keep the key order they were built in; nothing
+# reads them sorted or indented, even in debug mode.
+app.json.sort_keys = False
+app.json.compact = True
 # --- IMPORTANT: Changed logging level to DEBUG for troubleshooting ---
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
-# --- Initialize the global SSH client ---
-bqrm_ssh_client = None
+# Request threads only queue their log records; a single listener thread
+# hands them to the configured handlers, so writing to stderr never holds
+# up a request.
+_log_queue = queue.Queue(-1)
+_root_logger = logging.getLogger()
+_log_listener = logging.handlers.QueueListener(_log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [logging.handlers.QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# --- Initialize the global SSH connection pool ---
+# One connection per bulletin at most, capped at OpenSSH's default MaxSessions.
+SSH_POOL_SIZE = max(1, min(10, len(BULLETINS)))
+# Concurrent downloads and streamed full logs. Each holds an SFTP channel on a
+# pooled connection for as long as the browser takes to read it.
+SSH_STREAM_LIMIT = 4
+ssh_pool = None
 try:
-    bqrm_ssh_client = BQRMSshClient()
-    if bqrm_ssh_client.is_active():
-        logging.info("Global BQRMSshClient initialized and connected successfully.")
+    ssh_pool = BQRMSshPool(SSH_POOL_SIZE, SSH_STREAM_LIMIT)
+    if ssh_pool.is_active():
+        logging.info(f"Global BQRMSshPool (up to {SSH_POOL_SIZE} connections) initialized and connected successfully.")
     else:
-        logging.error("Global BQRMSshClient initialized but failed to connect. Check SSH configuration.")
+        logging.error("Global BQRMSshPool initialized but failed to connect. Check SSH configuration.")
 except Exception as e:
-    logging.critical(f"Failed to initialize global BQRMSshClient: {e}. All SSH-dependent operations will fail.")
-    bqrm_ssh_client = None
+    logging.critical(f"Failed to initialize global BQRMSshPool: {e}. All SSH-dependent operations will fail.")
+    ssh_pool = None
+
+if ssh_pool:
+    atexit.register(ssh_pool.close)
+    logging.info("Registered atexit handler for SSH pool closure.")
+
+# Re-connecting takes a TCP and SSH handshake, so it is done by a background
+# thread rather than on request threads, which fail fast meanwhile.
+SSH_RECONNECT_MAX_BACKOFF_SECONDS = 60
+_reconnect_event = threading.Event()
+
+def _reconnect_loop():
+    backoff = 1
+    while True:
+        _reconnect_event.wait()
+        try:
+            reconnected = ssh_pool.is_active()
+        except Exception as e:
+            logging.error(f"Background SSH re-connection failed: {e}")
+            reconnected = False
+        if reconnected:
+            logging.info("SSH connection restored by the background reconnector.")
+            _reconnect_event.clear()
+            backoff = 1
+        else:
+            logging.warning(f"SSH re-connection failed, retrying in {backoff}s.")
+            time.sleep(backoff)
+            backoff = min(backoff * 2, SSH_RECONNECT_MAX_BACKOFF_SECONDS)
 
-if bqrm_ssh_client:
-    atexit.register(bqrm_ssh_client.close)
-    logging.info("Registered atexit handler for SSH client closure.")
+if ssh_pool:
+    threading.Thread(target=_reconnect_loop, name="ssh-reconnect", daemon=True).start()
+    if not ssh_pool.is_healthy():
+        _reconnect_event.set()
 
 # --- Helper Functions for Log Parsing and Dynamic Paths ---
 
+def _build_keyword_regex(keywords, flags=re.IGNORECASE):
+    """
+    Compiles an alternation for the given keywords, case-insensitive by
+    default, grouped by leading character (e.g.
+    "E(?:XCEPTION|RROR)|F(?:AILURE|AILED)") so the regex engine can skip
+    ahead on the first literal character.
+    """
+    groups = {}
+    for kw in sorted(set(keywords), key=lambda k: (-len(k), k)):
+        groups.setdefault(kw[0].upper(), []).append(re.escape(kw[1:]))
+    alternation = "|".join(
+        f"{re.escape(first)}(?:{'|'.join(rests)})" for first, rests in sorted(groups.items())
+    )
+    return re.compile(alternation, flags)
+
+CRITICAL_RE = _build_keyword_regex(CRITICAL_KEYWORDS)
+ERROR_RE = _build_keyword_regex(ERROR_KEYWORDS)
+WARNING_RE = _build_keyword_regex(WARNING_KEYWORDS)
+
+# For status parsing, every keyword goes into one case-sensitive alternation
+# run over the upper-cased log, so the log is scanned once (IGNORECASE defeats
+# the literal-prefix search and is several times slower), and each match is
+# mapped back to its category. Built for str and for raw (bytes) content.
+_KEYWORD_CATEGORIES = {
+    keyword.upper(): category
+    for category, keywords in (
+        ("critical", CRITICAL_KEYWORDS),
+        ("error", ERROR_KEYWORDS),
+        ("success", SUCCESS_KEYWORDS),
+        ("warning", WARNING_KEYWORDS),
+    )
+    for keyword in keywords
+}
+_ALL_KEYWORDS_RE = {
+    str: _build_keyword_regex(_KEYWORD_CATEGORIES, flags=0),
+    bytes: re.compile(_build_keyword_regex(_KEYWORD_CATEGORIES, flags=0).pattern.encode()),
+}
+_KEYWORD_CATEGORIES_BY_TYPE = {
+    str: _KEYWORD_CATEGORIES,
+    bytes: {keyword.encode(): category for keyword, category in _KEYWORD_CATEGORIES.items()},
+}
+_FETCH_ERROR_MARKER = {str: "Error fetching log file", bytes: b"Error fetching log file"}
+
+# Logs are upper-cased for keyword scanning this many characters (rounded up
+# to a whole line) at a time, so no upper-cased copy of a large log is held.
+_KEYWORD_SCAN_CHUNK_SIZE = 1 << 16
+
+# Styled line classes by priority, when a line holds several keywords.
+_STYLE_PRIORITY = {"warning": 1, "error": 2, "critical": 3}
+
+# Matches a whole log line containing a severity keyword; the named group
+# that participates tells which class hit (critical > error > warning).
+# Only used for text whose upper-casing changes its length (see
+# _iter_keyword_matches).
+LINE_RE = re.compile(
+    rf"^(?P<critical>[^\n]*(?:{CRITICAL_RE.pattern})[^\n]*)"
+    rf"|^(?P<error>[^\n]*(?:{ERROR_RE.pattern})[^\n]*)"
+    rf"|^(?P<warning>[^\n]*(?:{WARNING_RE.pattern})[^\n]*)",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# Timestamped log lines start with "YYYY-MM-DD HH:MM:SS". This runs on raw
+# bytes with match(buffer, pos) at a line start, hence no "^".
+_TS_RE = re.compile(rb'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+
+def _wrap_styled_line(match):
+    return f'<span class="log-{match.lastgroup}">{match.group(0)}</span>'
+
+def _iter_keyword_matches(log_content):
+    """
+    Yields (line_start, category) for every keyword in the log content (str
+    or bytes), in order. The content is upper-cased one chunk of whole lines
+    at a time; keywords never span lines. line_start is None in chunks whose
+    upper-casing changed their length (e.g. "ß" -> "SS"), as offsets there
+    do not map back onto the content.
+    """
+    keyword_re = _ALL_KEYWORDS_RE[type(log_content)]
+    keyword_categories = _KEYWORD_CATEGORIES_BY_TYPE[type(log_content)]
+    newline = "\n" if isinstance(log_content, str) else b"\n"
+    length = len(log_content)
+    chunk_start = 0
+    while chunk_start < length:
+        chunk_end = log_content.find(newline, chunk_start + _KEYWORD_SCAN_CHUNK_SIZE)
+        chunk_end = length if chunk_end < 0 else chunk_end + 1
+        chunk = log_content[chunk_start:chunk_end]
+        upper_chunk = chunk.upper()
+        offsets_match = len(upper_chunk) == len(chunk)
+        for match in keyword_re.finditer(upper_chunk):
+            line_start = None
+            if offsets_match:
+                line_start = chunk_start + upper_chunk.rfind(newline, 0, match.start()) + 1
+            yield line_start, keyword_categories[match.group()]
+        chunk_start = chunk_end
+
 def parse_log_status(log_content):
     """
     Analyzes the log content to determine the bulletin's status.
     Prioritizes CRITICAL > FAILED > SUCCESS.
     If SUCCESS is found, it remains SUCCESS even if WARNINGs are present,
     but a 'has_warnings' flag is set.
+    Accepts the log content as str or as raw bytes.
     """
-    if not log_content or "Error fetching log file" in log_content:
+    if not log_content or _FETCH_ERROR_MARKER[type(log_content)] in log_content:
         logging.debug("Log content is empty or contains fetch error, returning UNKNOWN status.")
         return "UNKNOWN", False
 
-    log_content_upper = log_content.upper()  
-    is_critical = any(kw in log_content_upper for kw in CRITICAL_KEYWORDS)
-    is_failed = any(kw in log_content_upper for kw in ERROR_KEYWORDS)
-    is_success = any(kw in log_content_upper for kw in SUCCESS_KEYWORDS)
-    is_warning = any(kw in log_content_upper for kw in WARNING_KEYWORDS)
+    found_categories = set()
+    for _, category in _iter_keyword_matches(log_content):
+        found_categories.add(category)
+        if category == "critical":
+            break  # Highest priority, nothing found later changes the status
+    is_critical = "critical" in found_categories
+    is_failed = "error" in found_categories
+    is_success = "success" in found_categories
+    is_warning = "warning" in found_categories
 
     final_status = "UNKNOWN"
     has_warnings_notification = False
@@ -66,7 +227,7 @@ def parse_log_status(log_content):
         final_status = "WARNING"
         logging.debug("WARNING status detected (no SUCCESS/FAILED/CRITICAL).")
     
-    logging.debug(f"Parsed log status: {final_status}, Has Warnings: {has_warnings_notification}")
+    logging.debug("Parsed log status: %s, Has Warnings: %s", final_status, has_warnings_notification)
     return final_status, has_warnings_notification
 
 
@@ -74,24 +235,43 @@ def format_full_log_with_styles(raw_log_content):
     """
     Parses raw log content and wraps lines containing specific keywords
     with <span> tags and corresponding CSS classes for styling.
+    The log text is HTML-escaped so it renders literally in the page.
     """
     if not raw_log_content:
         return ""
 
-    styled_lines = []
-    for line in raw_log_content.splitlines():
-        line_upper = line.upper()
-        
-        if any(kw in line_upper for kw in CRITICAL_KEYWORDS):
-            styled_lines.append(f'<span class="log-critical">{line}</span>')
-        elif any(kw in line_upper for kw in ERROR_KEYWORDS):
-            styled_lines.append(f'<span class="log-error">{line}</span>')
-        elif any(kw in line_upper for kw in WARNING_KEYWORDS):
-            styled_lines.append(f'<span class="log-warning">{line}</span>')
-        else:
-            styled_lines.append(line)
-    
-    return "\n".join(styled_lines)
+    # Keywords contain no HTML special characters, so escaping the whole
+    # buffer up front does not change which lines match.
+    escaped = html.escape(raw_log_content, quote=False)
+
+    # Find the keywords with the same single pass as parse_log_status, and
+    # keep the highest-priority class per line start.
+    line_classes = {}
+    for line_start, css_class in _iter_keyword_matches(escaped):
+        if line_start is None:
+            # A few characters (e.g. "ß") upper-case to several, so match
+            # offsets do not map back onto the log; use the line regex.
+            return LINE_RE.sub(_wrap_styled_line, escaped)
+        if css_class not in _STYLE_PRIORITY:
+            continue
+        current_class = line_classes.get(line_start)
+        if current_class is None or _STYLE_PRIORITY[current_class] < _STYLE_PRIORITY[css_class]:
+            line_classes[line_start] = css_class
+
+    # Matches come in order, and so do the line starts (dicts keep insertion order).
+    parts = []
+    last_end = 0
+    for line_start, css_class in line_classes.items():
+        line_end = escaped.find("\n", line_start)
+        if line_end < 0:
+            line_end = len(escaped)
+        parts.append(escaped[last_end:line_start])
+        parts.append(f'<span class="log-{css_class}">{escaped[line_start:line_end]}</span>')
+        last_end = line_end
+    parts.append(escaped[last_end:])
+    return "".join(parts)
+
+_TIME_TEMPLATE_FIELDS = ("Hour", "hour", "Minute", "minute", "Second", "second")
 
 def _resolve_dynamic_path(template_string, date=None):
     """
@@ -102,29 +282,49 @@ def _resolve_dynamic_path(template_string, date=None):
     if date is None:
         date = datetime.datetime.now()
 
-    # Define common date format variables
+    # Templates that only use date fields resolve the same way all day long,
+    # so they are cached per calendar day.
+    if not any("{" + field in template_string for field in _TIME_TEMPLATE_FIELDS):
+        date = date.date() if isinstance(date, datetime.datetime) else date
+    else:
+        date = date.replace(microsecond=0)
+    return _resolve_dynamic_path_cached(template_string, date)
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_dynamic_path_cached(template_string, date):
+    """
+    Cached worker for _resolve_dynamic_path. `date` is either a date or a
+    datetime truncated to the second, so equal inputs share one entry.
+    """
+    # Define common date format variables (plain dates have no time fields)
+    year = f"{date.year:04d}"
+    month = f"{date.month:02d}"
+    day = f"{date.day:02d}"
+    hour = f"{getattr(date, 'hour', 0):02d}"
+    minute = f"{getattr(date, 'minute', 0):02d}"
+    second = f"{getattr(date, 'second', 0):02d}"
     date_vars = {
-        "year": date.strftime("%Y"),
-        "year_short": date.strftime("%y"), # e.g., 24 for 2024
-        "month": date.strftime("%m"),      # e.g., 09 for September
-        "day": date.strftime("%d"),        # e.g., 05 for 5th
-        "Hour": date.strftime("%H"),
-        "hour": date.strftime("%H"),
-        "Minute": date.strftime("%M"),
-        "minute": date.strftime("%M"),
-        "Second": date.strftime("%S"),
-        "second": date.strftime("%S"),
-        "DD": date.strftime("%d"),  
-        "MM": date.strftime("%m"), 
-        "YYYY": date.strftime("%Y"),  
-        "Day": date.strftime("%d"),  
-        "Month": date.strftime("%m"),  
-        "Year": date.strftime("%Y"),  
+        "year": year,
+        "year_short": f"{date.year % 100:02d}", # e.g., 24 for 2024
+        "month": month,      # e.g., 09 for September
+        "day": day,          # e.g., 05 for 5th
+        "Hour": hour,
+        "hour": hour,
+        "Minute": minute,
+        "minute": minute,
+        "Second": second,
+        "second": second,
+        "DD": day,
+        "MM": month,
+        "YYYY": year,
+        "Day": day,
+        "Month": month,
+        "Year": year,
     }
     
     try:
         resolved_path = template_string.format(**date_vars)
-        logging.debug(f"Resolved dynamic path from template '{template_string}' with date {date.strftime('%Y-%m-%d')}: '{resolved_path}'")
+        logging.debug("Resolved dynamic path from template '%s' with date %s: '%s'", template_string, date.isoformat(), resolved_path)
         return resolved_path
     except KeyError as e:
         logging.error(f"Missing key in date_vars for template '{template_string}': {e}")
@@ -134,175 +334,378 @@ def _resolve_dynamic_path(template_string, date=None):
         return None
 
  
-LINES_TO_FETCH_FOR_DAILY_CHECK = 1000 
+# A short tail usually covers today's run; the longer one is only fetched
+# when it does not (see _get_log_content_for_check).
+LINES_TO_FETCH_FOR_TODAY = 200
+LINES_TO_FETCH_FOR_DAILY_CHECK = 2000
 
-def get_log_content_for_date_range(log_path, start_date, end_date):
+# Last line of a short tail that may have cut off the start of today's run.
+_UNCOVERED_MARKER = b"===BQRM_UNCOVERED==="
+
+def _date_filter_awk(start_date, end_date, lines_fetched=None):
     """
-    Fetches log lines within a specific date range from the remote log file.
-    This fetches a larger chunk and filters locally.
+    Builds an awk command that keeps only the log lines dated within
+    [start_date, end_date], plus the undated continuation lines that follow
+    them, so the filtering happens on the BQRM server rather than over SSH.
+    When `lines_fetched` (the tail's length) is given, _UNCOVERED_MARKER is
+    appended if the tail was full but had no line dated before end_date.
     """
-    logging.debug(f"Attempting to fetch log content for {log_path} from {start_date.date()} to {end_date.date()}")
-    if not bqrm_ssh_client or not bqrm_ssh_client.is_active():
-        logging.error(f"SSH client inactive, cannot fetch log for {log_path}.")
-        return "SSH_ERROR: Backend SSH client inactive."
-
-    # Fetch a larger tail to ensure we capture activity across days
-    command = f"tail -n {LINES_TO_FETCH_FOR_DAILY_CHECK} {log_path}"
-    success, output, error = bqrm_ssh_client.execute_command(command)
+    program = (
+        '/^[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]/ '
+        '{ d = substr($0, 1, 10); if (d < d2) earlier = 1; if (d >= d1 && d <= d2) { started = 1; print }; next } '
+        'started { print }'
+    )
+    if lines_fetched is not None:
+        program += f' END {{ if (!earlier && NR >= {lines_fetched}) print "{_UNCOVERED_MARKER.decode()}" }}'
+    return (
+        f"awk -v d1={start_date.date().isoformat()} -v d2={end_date.date().isoformat()} "
+        f"{shlex.quote(program)}"
+    )
+
+def get_log_content_for_date_range(log_path, start_date, end_date, lines_to_fetch=LINES_TO_FETCH_FOR_DAILY_CHECK, mark_uncovered=False):
+    """
+    Fetches log lines within a specific date range from the last
+    `lines_to_fetch` lines of the remote log file.
+    The tail is filtered by date on the remote side before being sent back.
+    With `mark_uncovered`, the content may end with _UNCOVERED_MARKER (see
+    _short_tail_covers_today).
+    Returns the raw (bytes) log content, or a bytes error message.
+    """
+    logging.debug("Attempting to fetch log content for %s from %s to %s", log_path, start_date.date(), end_date.date())
+    awk_filter = _date_filter_awk(start_date, end_date, lines_to_fetch if mark_uncovered else None)
+    command = f"tail -n {lines_to_fetch} {log_path} | {awk_filter}"
+    with ssh_pool.acquire() as client:
+        if not client.is_active():
+            logging.error(f"SSH client inactive, cannot fetch log for {log_path}.")
+            return b"SSH_ERROR: Backend SSH client inactive."
+        success, output, error = client.execute_command(command, decode=False)
 
     if not success:
         logging.warning(f"Could not fetch log for {log_path}. Error: {error}")
-        return f"Error fetching log file '{log_path}': {error}"
-
-    filtered_lines = []
-    # Regex to match YYYY-MM-DD at the start of a line
-    date_pattern = re.compile(r'^(\d{4}-\d{2}-\d{2})')
-
-    for line in output.splitlines():
-        match = date_pattern.match(line)
-        if match:
-            log_date_str = match.group(1)
-            try:
-                log_date = datetime.datetime.strptime(log_date_str, '%Y-%m-%d').date()
-                if start_date.date() <= log_date <= end_date.date():
-                    filtered_lines.append(line)
-            except ValueError:
- 
-                 pass
- 
-        elif filtered_lines: # If we've already started collecting lines
-            filtered_lines.append(line)
-            
-    logging.debug(f"Fetched {len(filtered_lines)} lines for date range from {log_path}.")
-    return "\n".join(filtered_lines)
-
-
-def _get_latest_timestamp_from_log_content(log_content, date_filter=None):
-    """
-    Finds the latest timestamp in the given log content, optionally filtered by date.
-    Returns the timestamp string or None.
-    """
-    timestamp_pattern = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
-    latest_timestamp = None
-    latest_dt = None
-
-    for line in reversed(log_content.splitlines()):
-        match = timestamp_pattern.match(line)
-        if match:
-            try:
-                current_dt = datetime.datetime.strptime(match.group(0), '%Y-%m-%d %H:%M:%S')
-                if date_filter and current_dt.date() != date_filter.date():
-                    continue # Skip if not for the filtered date
-                
-                if latest_dt is None or current_dt > latest_dt:
-                    latest_dt = current_dt
-                    latest_timestamp = match.group(0)
-            except ValueError:
-                continue
-    logging.debug(f"Latest timestamp found (filtered by {date_filter.date() if date_filter else 'None'}): {latest_timestamp}")
-    return latest_timestamp
+        return f"Error fetching log file '{log_path}': {error}".encode()
+
+    logging.debug("Fetched %s bytes for date range from %s.", len(output), log_path)
+    return output
+
+
+_PREFETCH_SENTINEL_RE = re.compile(rb'^===BQRM_(LOG|STAT):(.*)===$', re.MULTILINE)
+
+def _batched_tail_script(log_paths, lines_to_fetch, current_date, mark_uncovered=False):
+    """
+    Builds a shell loop that prints, for each log, a sentinel line followed
+    by yesterday's and today's lines from its last `lines_to_fetch` lines
+    (and _UNCOVERED_MARKER, with `mark_uncovered`).
+    """
+    awk_filter = _date_filter_awk(
+        current_date - datetime.timedelta(days=1), current_date, lines_to_fetch if mark_uncovered else None
+    )
+    return (
+        f"for p in {' '.join(shlex.quote(p) for p in log_paths)}; do "
+        f"echo \"===BQRM_LOG:$p===\"; tail -n {lines_to_fetch} \"$p\" 2>/dev/null "
+        f"| {awk_filter}; done"
+    )
+
+def _split_sentinel_sections(output):
+    """
+    Slices the raw output of a batched command into its sections, between
+    consecutive sentinels. Returns {b"LOG": {path: bytes}, b"STAT": {path: bytes}}.
+    """
+    sections = {b"LOG": {}, b"STAT": {}}
+    sentinels = list(_PREFETCH_SENTINEL_RE.finditer(output))
+    for i, match in enumerate(sentinels):
+        section_start = match.end() + 1
+        section_end = sentinels[i + 1].start() - 1 if i + 1 < len(sentinels) else len(output)
+        sections[match.group(1)][match.group(2).decode()] = output[section_start:max(section_start, section_end)]
+    return sections
+
+def _short_tail_covers_today(log_content):
+    """
+    Tells whether a short (LINES_TO_FETCH_FOR_TODAY) tail fetched with
+    `mark_uncovered` is enough for the status check. The remote filter marks
+    it otherwise, judging from the raw tail: the filtered lines alone cannot
+    tell whether undated lines were dropped from before today's first one.
+    """
+    return log_content.rpartition(b"\n")[2] != _UNCOVERED_MARKER
+
+def _prefetch_bulletin_data(bulletin_configs, current_date):
+    """
+    Fetches the log tail of every given bulletin and the existence of each of
+    today's product files with a single remote command, instead of one SSH
+    round trip per log and per product. Logs whose short tail does not cover
+    today's run get their longer tail in one more batched command.
+    Returns a dict with "logs" (log_path -> yesterday's and today's lines, as
+    bytes), "products" (remote_path -> bool) and "fetched_at" (monotonic
+    time), or None if the batch could not be fetched.
+    """
+    log_paths = list(dict.fromkeys(b["log_path"] for b in bulletin_configs))
+    product_paths = []
+    for bulletin_config in bulletin_configs:
+        for product_template_details in bulletin_config.get("product_paths", []):
+            remote_product_path = _resolve_dynamic_path(product_template_details["template"], current_date)
+            if remote_product_path and remote_product_path not in product_paths:
+                product_paths.append(remote_product_path)
+
+    script_parts = []
+    if log_paths:
+        script_parts.append(_batched_tail_script(log_paths, LINES_TO_FETCH_FOR_TODAY, current_date, mark_uncovered=True))
+    if product_paths:
+        script_parts.append(
+            f"for f in {' '.join(shlex.quote(f) for f in product_paths)}; do "
+            f"echo \"===BQRM_STAT:$f===\"; if [ -e \"$f\" ]; then echo Y; else echo N; fi; done"
+        )
+    fetched_at = time.monotonic()
+    if not script_parts:
+        return {"logs": {}, "products": {}, "fetched_at": fetched_at}
+
+    with ssh_pool.acquire() as client:
+        if not client.is_active():
+            return None
+        success, output, error = client.execute_command("; ".join(script_parts), decode=False)
+        if not success:
+            logging.warning(f"Batched bulletin fetch failed, falling back to per-bulletin fetches. Error: {error}")
+            return None
+        sections = _split_sentinel_sections(output)
+
+        uncovered_paths = [p for p, content in sections[b"LOG"].items() if not _short_tail_covers_today(content)]
+        if uncovered_paths:
+            success, output, error = client.execute_command(
+                _batched_tail_script(uncovered_paths, LINES_TO_FETCH_FOR_DAILY_CHECK, current_date), decode=False
+            )
+            if success:
+                sections[b"LOG"].update(_split_sentinel_sections(output)[b"LOG"])
+            else:
+                # Leave these logs to the per-bulletin fetch, which escalates on its own.
+                logging.warning(f"Batched long tail fetch failed for {uncovered_paths}. Error: {error}")
+                for path in uncovered_paths:
+                    del sections[b"LOG"][path]
+
+    prefetched = {
+        "logs": sections[b"LOG"],
+        "products": {path: section.strip() == b"Y" for path, section in sections[b"STAT"].items()},
+        "fetched_at": fetched_at,
+    }
+    logging.debug("Prefetched %s logs (%s long tails) and %s product paths.", len(prefetched['logs']), len(uncovered_paths), len(prefetched['products']))
+    return prefetched
+
+
+def _get_log_content_for_check(log_path, current_date, prefetched=None):
+    """
+    Returns yesterday's and today's log lines (bytes) for the status check.
+    Prefetched content is used as is. Otherwise the short tail is fetched,
+    and the longer one only when the short tail does not cover today's run
+    (see _short_tail_covers_today).
+    """
+    if prefetched and log_path in prefetched["logs"]:
+        return prefetched["logs"][log_path]
+
+    yesterday_date = current_date - datetime.timedelta(days=1)
+    log_content = get_log_content_for_date_range(log_path, yesterday_date, current_date, LINES_TO_FETCH_FOR_TODAY, mark_uncovered=True)
+    if b"SSH_ERROR" in log_content or _short_tail_covers_today(log_content):
+        return log_content
+
+    logging.debug("Short tail of %s does not cover today's run, fetching %s lines.", log_path, LINES_TO_FETCH_FOR_DAILY_CHECK)
+    return get_log_content_for_date_range(log_path, yesterday_date, current_date, LINES_TO_FETCH_FOR_DAILY_CHECK)
 
+def _is_valid_timestamp(timestamp):
+    """
+    Range-checks a "YYYY-MM-DD HH:MM:SS" (bytes) value already matched by
+    _TS_RE, accepting what strptime('%Y-%m-%d %H:%M:%S') would without
+    interpreting the format string for every line.
+    """
+    year, month, day = int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10])
+    return (year >= 1 and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]
+            and int(timestamp[11:13]) < 24 and int(timestamp[14:16]) < 60 and int(timestamp[17:19]) < 60)
 
-def get_bulletin_details_summary(bulletin_config):
+def _find_last_timestamp(log_content):
+    """
+    Returns the timestamp of the last validly timestamped line in the raw
+    log content, or None. Logs are appended chronologically, so this walks
+    line starts backwards from the end and usually stops after a line or two.
+    """
+    pos = len(log_content)
+    while pos >= 0:
+        line_start = log_content.rfind(b"\n", 0, pos) + 1
+        if _TS_RE.match(log_content, line_start) and _is_valid_timestamp(log_content[line_start:line_start + 19]):
+            return log_content[line_start:line_start + 19].decode()
+        pos = line_start - 1
+    return None
+
+# A run of lines belonging to one day: a line starting "YYYY-MM-DD", then
+# every following line that starts with the same date or with no date at all.
+_DAY_RUN_RE = re.compile(rb"^(\d{4}-\d{2}-\d{2})[^\n]*(?:\n(?:\1|(?!\d{4}-\d{2}-\d{2}))[^\n]*)*", re.MULTILINE)
+
+def _scan_log(log_content, today_str, yesterday_str):
+    """
+    Splits the raw (bytes) log content into per-day sections keyed by the
+    "YYYY-MM-DD" line prefix (undated continuation lines follow the last
+    dated line), then takes the latest timestamp of today's and yesterday's
+    section from its end. Each run of same-day lines is one regex match, so
+    the lines themselves are never walked in Python.
+    Returns (today_content, yesterday_content, latest_today, latest_yesterday),
+    where the contents are bytes and the timestamps are strings or None.
+    """
+    spans_by_day = {}
+    for run in _DAY_RUN_RE.finditer(log_content):
+        spans = spans_by_day.get(run.group(1))
+        if spans is None:
+            spans = spans_by_day[run.group(1)] = []
+        # Include the newline ending the run, as the section joins expect.
+        spans.append((run.start(), run.end() + 1))
+
+    contents = []
+    for day_str in (today_str, yesterday_str):
+        content = b"".join(log_content[start:end] for start, end in spans_by_day.get(day_str.encode(), ()))
+        contents.append(content[:-1] if content.endswith(b"\n") else content)
+    today_content, yesterday_content = contents
+    return today_content, yesterday_content, _find_last_timestamp(today_content), _find_last_timestamp(yesterday_content)
+
+
+# Summaries are reused for this many seconds so dashboard polling does not
+# re-fetch and re-parse every log. Keyed by bulletin id, stored as
+# (monotonic time the data was fetched, date, summary).
+SUMMARY_CACHE_TTL_SECONDS = 10
+_SUMMARY_CACHE = {}
+# Bulletin id -> monotonic time of its last invalidation (e.g. a re-run), so
+# a summary fetched before it is not stored afterwards.
+_SUMMARY_INVALIDATED_AT = {}
+_summary_cache_lock = threading.Lock()
+
+# Maximum number of bulletin summaries computed concurrently. The pool is
+# created once and shared by all requests rather than spun up per request.
+SUMMARY_WORKERS = 8
+_summary_executor = ThreadPoolExecutor(
+    max_workers=max(1, min(SUMMARY_WORKERS, len(BULLETINS))), thread_name_prefix="bulletin-summary"
+)
+
+def _get_cached_summary(bulletin_id, current_date):
+    """
+    Returns the cached summary for a bulletin if it is still fresh, else None.
+    """
+    with _summary_cache_lock:
+        cached = _SUMMARY_CACHE.get(bulletin_id)
+    if cached:
+        cached_at, cached_date, cached_summary = cached
+        if cached_date == current_date.date() and time.monotonic() - cached_at < SUMMARY_CACHE_TTL_SECONDS:
+            return cached_summary
+    return None
+
+def _store_cached_summary(bulletin_id, fetched_at, current_date, summary):
+    with _summary_cache_lock:
+        if _SUMMARY_INVALIDATED_AT.get(bulletin_id, float("-inf")) >= fetched_at:
+            logging.debug("Not caching summary for %s: it was invalidated while being fetched.", bulletin_id)
+            return
+        _SUMMARY_CACHE[bulletin_id] = (fetched_at, current_date.date(), summary)
+
+def _invalidate_cached_summary(bulletin_id):
+    with _summary_cache_lock:
+        _SUMMARY_CACHE.pop(bulletin_id, None)
+        _SUMMARY_INVALIDATED_AT[bulletin_id] = time.monotonic()
+
+def _ssh_error_summary(bulletin_config, current_date):
+    """
+    Builds the summary of a bulletin whose status could not be checked
+    because no SSH connection was available.
+    """
+    # For products, we can't check availability if SSH is down
+    product_info_list = []
+    for product_template_details in bulletin_config.get("product_paths", []):
+        product_info_list.append({
+            "name": product_template_details.get("name", "Product"),
+            "available": False,
+            # Still resolve path for display/info, even if not available
+            "remote_path": _resolve_dynamic_path(product_template_details["template"], current_date)
+        })
+    return {
+        "id": bulletin_config["id"],
+        "name": bulletin_config["name"],
+        "status": "SSH_ERROR",
+        "last_run": "N/A",
+        "has_warnings": False,
+        "product_info": product_info_list
+    }
+
+def get_bulletin_details_summary(bulletin_config, prefetched=None, exists_cache=None):
     """
     Fetches the latest status and a summary of the log for a single bulletin,
     specifically focusing on today's run and product availability.
+    If `prefetched` (see _prefetch_bulletin_data) is given, the log tail and
+    product existence are taken from it instead of separate SSH calls.
+    `exists_cache` is an optional remote_path -> bool dict shared across the
+    bulletins of one request, so a path is only checked once.
     """
-    logging.debug(f"Getting summary for bulletin: {bulletin_config['id']}")
+    logging.debug("Getting summary for bulletin: %s", bulletin_config['id'])
     current_date = datetime.datetime.now()
     yesterday_date = current_date - datetime.timedelta(days=1)
 
+    cached_summary = _get_cached_summary(bulletin_config["id"], current_date)
+    if cached_summary:
+        logging.debug("Returning cached summary for bulletin: %s", bulletin_config['id'])
+        return cached_summary
+    fetched_at = prefetched["fetched_at"] if prefetched else time.monotonic()
+
     # Default values if SSH fails or no run today
     status = "UNKNOWN"
     last_run_time = "N/A"
     has_warnings_notification = False
     product_info_list = []
 
-    if not bqrm_ssh_client or not bqrm_ssh_client.is_active():
-        status = "SSH_ERROR"
-        # For products, we can't check availability if SSH is down
-        for product_template_details in bulletin_config.get("product_paths", []):
-            product_info_list.append({
-                "name": product_template_details.get("name", "Product"),
-                "available": False,
-                # Still resolve path for display/info, even if not available
-                "remote_path": _resolve_dynamic_path(product_template_details["template"], current_date) 
-            })
-        logging.debug(f"Bulletin {bulletin_config['id']} returning SSH_ERROR due to inactive client.")
-        return {
-            "id": bulletin_config["id"],
-            "name": bulletin_config["name"],
-            "status": status,
-            "last_run": last_run_time,
-            "has_warnings": has_warnings_notification,
-            "product_info": product_info_list
-        }
+    if not ssh_pool.is_healthy():
+        logging.debug("Bulletin %s returning SSH_ERROR due to inactive client.", bulletin_config['id'])
+        return _ssh_error_summary(bulletin_config, current_date)
 
     # 1. Get log content for today and yesterday
-    log_content_for_check = get_log_content_for_date_range(bulletin_config["log_path"], yesterday_date, current_date)
+    log_content_for_check = _get_log_content_for_check(bulletin_config["log_path"], current_date, prefetched)
     
-    if "SSH_ERROR" in log_content_for_check:
+    if b"SSH_ERROR" in log_content_for_check:
         status = "SSH_ERROR"
         last_run_time = "N/A (Log fetch error)"
-        logging.debug(f"Bulletin {bulletin_config['id']} returning SSH_ERROR due to log fetch error.")
+        logging.debug("Bulletin %s returning SSH_ERROR due to log fetch error.", bulletin_config['id'])
     else:
-        # Filter log content to only include today's entries for status parsing
-        today_log_lines = []
-        current_date_str = current_date.strftime('%Y-%m-%d')
-        for line in log_content_for_check.splitlines():
-            if line.startswith(current_date_str):
-                today_log_lines.append(line)
-
-
-            elif today_log_lines and not re.match(r'^\d{4}-\d{2}-\d{2}', line):
-                today_log_lines.append(line)
-        today_log_content = "\n".join(today_log_lines)
-        logging.debug(f"Today's log content for {bulletin_config['id']} (first 200 chars): {today_log_content[:200]}...")
-
+        # Split the log into today's and yesterday's entries in a single pass
+        today_log_content, yesterday_log_content, latest_run_today, latest_run_yesterday = _scan_log(
+            log_content_for_check, current_date.date().isoformat(), yesterday_date.date().isoformat()
+        )
+        logging.debug("Today's log content for %s (first 200 bytes): %s...", bulletin_config['id'], today_log_content[:200])
 
         # 2. Determine last run time and status for today
-        latest_run_today = _get_latest_timestamp_from_log_content(today_log_content, current_date)
-        
         if latest_run_today:
             last_run_time = latest_run_today
             # Parse status based *only* on today's relevant log entries
             status, has_warnings_notification = parse_log_status(today_log_content)
-            logging.debug(f"Bulletin {bulletin_config['id']} status: {status}, last_run: {last_run_time} (today)")
+            logging.debug("Bulletin %s status: %s, last_run: %s (today)", bulletin_config['id'], status, last_run_time)
         else:
             # No run found today. Check if there was a run yesterday for "PENDING" status.
-            yesterday_log_lines = []
-            yesterday_date_str = yesterday_date.strftime('%Y-%m-%d')
-            for line in log_content_for_check.splitlines():
-                if line.startswith(yesterday_date_str):
-                    yesterday_log_lines.append(line)
-                elif yesterday_log_lines and not re.match(r'^\d{4}-\d{2}-\d{2}', line):
-                    yesterday_log_lines.append(line)
-            yesterday_log_content = "\n".join(yesterday_log_lines)
-            logging.debug(f"Yesterday's log content for {bulletin_config['id']} (first 200 chars): {yesterday_log_content[:200]}...")
-
-
-            latest_run_yesterday = _get_latest_timestamp_from_log_content(yesterday_log_content, yesterday_date)
-            
+            logging.debug("Yesterday's log content for %s (first 200 bytes): %s...", bulletin_config['id'], yesterday_log_content[:200])
+
             if latest_run_yesterday:
                 # It ran yesterday, but not today. Status is PENDING.
                 status = "PENDING"
                 last_run_time = f"N/A (Last run: {latest_run_yesterday} - Yesterday)"
-                logging.debug(f"Bulletin {bulletin_config['id']} status: PENDING, last_run: {last_run_time} (yesterday)")
+                logging.debug("Bulletin %s status: PENDING, last_run: %s (yesterday)", bulletin_config['id'], last_run_time)
             else:
                 # No run found today or yesterday. Status is NO_RECENT_RUN.
                 status = "NO_RECENT_RUN"
                 last_run_time = "N/A (No recent runs today or yesterday)"
-                logging.debug(f"Bulletin {bulletin_config['id']} status: NO_RECENT_RUN")
+                logging.debug("Bulletin %s status: NO_RECENT_RUN", bulletin_config['id'])
 
     # 3. Check product availability for today
-    for product_template_details in bulletin_config.get("product_paths", []):
-        remote_product_path = _resolve_dynamic_path(product_template_details["template"], current_date)
+    product_templates = bulletin_config.get("product_paths", [])
+    remote_product_paths = [_resolve_dynamic_path(p["template"], current_date) for p in product_templates]
+    existing_products = exists_cache if exists_cache is not None else {}
+    if prefetched:
+        existing_products.update(prefetched["products"])
+    unchecked_paths = [p for p in remote_product_paths if p and p not in existing_products]
+    if unchecked_paths:
+        with ssh_pool.acquire() as client:
+            existing_products.update(client.files_exist(unchecked_paths))
+
+    for product_template_details, remote_product_path in zip(product_templates, remote_product_paths):
         is_available = False
         if remote_product_path:
-            is_available = bqrm_ssh_client.file_exists(remote_product_path)
-            logging.debug(f"Product '{product_template_details.get('name', 'Product')}' for {bulletin_config['id']}: Checking path='{remote_product_path}', Exists={is_available}")
+            is_available = existing_products.get(remote_product_path, False)
+            logging.debug("Product '%s' for %s: Checking path='%s', Exists=%s", product_template_details.get('name', 'Product'), bulletin_config['id'], remote_product_path, is_available)
             if not is_available:
-                logging.debug(f"Product not found for {bulletin_config['name']}: {remote_product_path}")
+                logging.debug("Product not found for %s: %s", bulletin_config['name'], remote_product_path)
         else:
             logging.error(f"Could not resolve product path for {bulletin_config['name']} with template {product_template_details['template']}")
 
@@ -312,7 +715,7 @@ def get_bulletin_details_summary(bulletin_config):
             "remote_path": remote_product_path
         })
 
-    return {
+    summary = {
         "id": bulletin_config["id"],
         "name": bulletin_config["name"],
         "status": status,
@@ -320,36 +723,111 @@ def get_bulletin_details_summary(bulletin_config):
         "has_warnings": has_warnings_notification,
         "product_info": product_info_list
     }
+    if status != "SSH_ERROR":
+        _store_cached_summary(bulletin_config["id"], fetched_at, current_date, summary)
+    return summary
+
+# The full log view shows at most this much of the end of the log.
+FULL_LOG_MAX_BYTES = 2 * 1024 * 1024
 
 def get_full_log_content(log_path):
     """
-    Fetches the entire content of a log file from the BQRM server.
+    Fetches the content of a log file from the BQRM server over SFTP, up to
+    its last FULL_LOG_MAX_BYTES bytes. A longer log is cut at a line start,
+    behind a banner saying so.
     """
-    logging.debug(f"Fetching full log content for {log_path}")
-    if not bqrm_ssh_client or not bqrm_ssh_client.is_active():
-        return "Backend SSH client not initialized or connection inactive. Cannot fetch full log."
-
-    command = f"cat {log_path}"
-    success, output, error = bqrm_ssh_client.execute_command(command)
-    if success:
-        return output
-    else:
+    logging.debug("Fetching full log content for %s", log_path)
+    with ssh_pool.acquire() as client:
+        if not client.is_active():
+            return "Backend SSH client not initialized or connection inactive. Cannot fetch full log."
+        content, truncated, error = client.read_tail(log_path, FULL_LOG_MAX_BYTES)
+    if error:
         logging.warning(f"Could not fetch full log for {log_path}. Error: {error}")
         return f"Error fetching full log file '{log_path}': {error}"
 
+    content = content.decode(errors="replace").strip()
+    if truncated:
+        # Drop the first line, which most likely starts mid-line.
+        content = content.partition("\n")[2]
+        content = f"... (log truncated, showing its last {FULL_LOG_MAX_BYTES // (1024 * 1024)} MiB) ...\n{content}"
+    return content
+
 # --- API Endpoints ---
 
 @app.route('/')
 def serve_index():
     return send_from_directory(app.static_folder, 'index.html')
 
+def _iter_bulletin_summaries(exists_cache, summarize_pool_errors=False):
+    """
+    Yields (index, summary) for every configured bulletin as soon as it is
+    ready: cached summaries first, then the others as their fetches complete.
+    With `summarize_pool_errors`, a bulletin that could not get a pooled SSH
+    connection yields an SSH_ERROR summary instead of raising, for callers
+    that have already started their response.
+    """
+    current_date = datetime.datetime.now()
+    stale_bulletins = []
+    for index, bulletin_config in enumerate(BULLETINS):
+        cached_summary = _get_cached_summary(bulletin_config["id"], current_date)
+        if cached_summary:
+            yield index, cached_summary
+        else:
+            stale_bulletins.append((index, bulletin_config))
+    if not stale_bulletins:
+        return
+
+    try:
+        prefetched = _prefetch_bulletin_data([b for _, b in stale_bulletins], current_date)
+    except (SshPoolExhausted, SshConnectionLost) as e:
+        if not summarize_pool_errors:
+            raise
+        # Leave each bulletin to its own fetch, which reports its own failure.
+        logging.warning(f"Batched bulletin fetch could not get an SSH connection: {e}")
+        prefetched = None
+    # Bulletins not covered by the batched prefetch fetch over SSH, so run
+    # them concurrently on separate channels instead of one after another.
+    futures = {
+        _summary_executor.submit(get_bulletin_details_summary, bulletin_config, prefetched, exists_cache): index
+        for index, bulletin_config in stale_bulletins
+    }
+    for future in as_completed(futures):
+        index = futures[future]
+        try:
+            summary = future.result()
+        except (SshPoolExhausted, SshConnectionLost) as e:
+            if not summarize_pool_errors:
+                raise
+            if isinstance(e, SshConnectionLost):
+                _reconnect_event.set()
+            logging.warning(f"Summary for bulletin {BULLETINS[index]['id']} could not get an SSH connection: {e}")
+            summary = _ssh_error_summary(BULLETINS[index], current_date)
+        yield index, summary
+
 @app.route('/api/bulletins', methods=['GET'])
 def get_all_bulletins_status():
     logging.info("Received request for all bulletin statuses (summary).")
-    results = []
-    for bulletin_config in BULLETINS:
-        results.append(get_bulletin_details_summary(bulletin_config))
-    return jsonify(results)
+    # Worker threads have no app context, so hand them the request's cache.
+    # Pool errors propagate, so the errorhandlers answer them with a 503.
+    summaries = dict(_iter_bulletin_summaries(g.exists_cache, summarize_pool_errors=False))
+    return jsonify([summaries[index] for index in sorted(summaries)])
+
+@app.route('/api/bulletins/stream', methods=['GET'])
+def stream_all_bulletins_status():
+    """
+    Streams the bulletin summaries as NDJSON, one line per bulletin as soon
+    as it is ready, each tagged with its "index" in the configuration so the
+    dashboard can render cards progressively in a stable order.
+    """
+    logging.info("Received request for streamed bulletin statuses (summary).")
+    exists_cache = g.exists_cache
+
+    def generate():
+        # The 200 is already sent, so report pool errors per bulletin instead.
+        for index, summary in _iter_bulletin_summaries(exists_cache, summarize_pool_errors=True):
+            yield json.dumps(dict(summary, index=index)) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
 
 @app.route('/api/bulletins/<string:bulletin_id>/full_log', methods=['GET'])
 def get_bulletin_full_log(bulletin_id):
@@ -359,11 +837,7 @@ def get_bulletin_full_log(bulletin_id):
     """
     logging.info(f"Received request for full log for bulletin ID: {bulletin_id}")
 
-    if not bqrm_ssh_client or not bqrm_ssh_client.is_active():
-        logging.error(f"Cannot fetch full log for {bulletin_id}: SSH client not initialized or connection inactive.")
-        return jsonify({"message": "Backend SSH client not initialized or connection inactive. Cannot fetch log.", "success": False}), 503
-
-    bulletin = next((b for b in BULLETINS if b["id"] == bulletin_id), None)
+    bulletin = BULLETINS_BY_ID.get(bulletin_id)
     if not bulletin:
         logging.warning(f"Full log request for unknown bulletin ID: {bulletin_id}")
         abort(404, description=f"Bulletin with ID '{bulletin_id}' not found.")
@@ -375,21 +849,87 @@ def get_bulletin_full_log(bulletin_id):
     return jsonify({"bulletin_id": bulletin_id, "name": bulletin["name"], "full_log": styled_full_log})
 
 
+def _iter_styled_log(chunks, offset):
+    """
+    Yields the styled log read from `chunks` (starting at `offset` in the
+    file), one block of whole lines per SFTP chunk, so neither the raw nor
+    the styled log is held in memory at once. Blocks are split at line ends,
+    which styling and UTF-8 decoding never cross. When `offset` is not 0 the
+    partial first line is replaced by the truncation banner.
+    """
+    pending = b""
+    separator = ""
+    skip_partial_line = offset > 0
+    if skip_partial_line:
+        yield f"... (log truncated, showing its last {FULL_LOG_MAX_BYTES // (1024 * 1024)} MiB) ..."
+        separator = "\n"
+    for chunk in chunks:
+        pending += chunk
+        block_end = pending.rfind(b"\n")
+        if block_end < 0:
+            continue
+        block, pending = pending[:block_end], pending[block_end + 1:]
+        if skip_partial_line:
+            block = block.partition(b"\n")[2]
+            skip_partial_line = False
+            if not block:
+                continue
+        yield separator + format_full_log_with_styles(block.decode(errors="replace"))
+        separator = "\n"
+    if pending and not skip_partial_line:
+        yield separator + format_full_log_with_styles(pending.decode(errors="replace"))
+
+@app.route('/api/bulletins/<string:bulletin_id>/full_log/stream', methods=['GET'])
+def stream_bulletin_full_log(bulletin_id):
+    """
+    Streams the styled full log (up to its last FULL_LOG_MAX_BYTES) as HTML
+    fragments, so the log view can render it as it arrives.
+    """
+    logging.info(f"Received request for streamed full log for bulletin ID: {bulletin_id}")
+
+    bulletin = BULLETINS_BY_ID.get(bulletin_id)
+    if not bulletin:
+        logging.warning(f"Full log request for unknown bulletin ID: {bulletin_id}")
+        abort(404, description=f"Bulletin with ID '{bulletin_id}' not found.")
+
+    try:
+        with ssh_pool.acquire() as client:
+            file_size = client.get_file_size(bulletin["log_path"])
+    except (SshPoolExhausted, SshConnectionLost):
+        raise
+    except Exception as e:
+        logging.error(f"Could not fetch full log for {bulletin['log_path']}. Error: {e}")
+        return jsonify({"message": f"Error fetching full log file for '{bulletin['name']}': {e}", "success": False}), 500
+    if file_size is None:
+        logging.warning(f"Could not fetch full log for {bulletin['log_path']}: file not found.")
+        return jsonify({"message": f"Log file for '{bulletin['name']}' not found on remote server.", "success": False}), 404
+
+    offset = max(0, file_size - FULL_LOG_MAX_BYTES)
+    chunks = ssh_pool.open_stream(bulletin["log_path"], chunk_size=1 << 16, offset=offset)
+    blocks = _iter_styled_log(chunks, offset)
+    if not request.accept_encodings["gzip"]:
+        return Response(stream_with_context(blocks), mimetype='text/html')
+    response = Response(stream_with_context(_gzip_stream(blocks)), mimetype='text/html')
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
 @app.route('/api/bulletins/<string:bulletin_id>/rerun', methods=['POST'])
 def rerun_single_bulletin(bulletin_id):
     logging.info(f"Received re-run request for bulletin ID: {bulletin_id}")
 
-    if not bqrm_ssh_client or not bqrm_ssh_client.is_active():
-        logging.error(f"Cannot re-run {bulletin_id}: SSH client not initialized or connection inactive.")
-        return jsonify({"message": "Backend SSH client not initialized or connection inactive. Cannot re-run.", "success": False}), 503
-
-    bulletin = next((b for b in BULLETINS if b["id"] == bulletin_id), None)
+    bulletin = BULLETINS_BY_ID.get(bulletin_id)
     if not bulletin:
         logging.warning(f"Re-run request for unknown bulletin ID: {bulletin_id}")
         return jsonify({"message": f"Bulletin with ID '{bulletin_id}' not found.", "success": False}), 404
 
     logging.info(f"Attempting to execute re-run command for bulletin '{bulletin['name']}': {bulletin['rerun_command']}")
-    success, output, error = bqrm_ssh_client.execute_command(bulletin["rerun_command"])
+    with ssh_pool.acquire() as client:
+        # Bulletin scripts can run quietly for minutes; wait for them to exit.
+        success, output, error = client.execute_command(bulletin["rerun_command"], reuse_shell=False, idle_timeout=None)
+    # Drop the cached summary so the next poll reflects the re-run.
+    _invalidate_cached_summary(bulletin_id)
 
     if success:
         logging.info(f"Re-run command for '{bulletin['name']}' sent successfully.")
@@ -398,15 +938,26 @@ def rerun_single_bulletin(bulletin_id):
         logging.error(f"Failed to execute re-run command for '{bulletin['name']}'. Error: {error}")
         return jsonify({"message": f"Failed to send re-run command for '{bulletin['name']}'.", "error": error, "output": output, "success": False}), 500
 
+def _attachment_disposition(filename):
+    """
+    Builds the Content-Disposition header send_file() would: the name is
+    quoted as needed, and a non-ASCII name also goes in an RFC 5987
+    filename* parameter, with an ASCII approximation in filename.
+    """
+    try:
+        filename.encode("ascii")
+    except UnicodeEncodeError:
+        ascii_filename = unicodedata.normalize("NFKD", filename).encode("ascii", "ignore").decode("ascii")
+        names = {"filename": ascii_filename, "filename*": f"UTF-8''{quote(filename, safe='!#$&+-.^_`|~')}"}
+    else:
+        names = {"filename": filename}
+    return dump_options_header("attachment", names)
+
 @app.route('/api/bulletins/<string:bulletin_id>/download_product', methods=['GET'])
 def download_bulletin_product(bulletin_id):
     logging.info(f"Received download product request for bulletin ID: {bulletin_id}")
 
-    if not bqrm_ssh_client or not bqrm_ssh_client.is_active():
-        logging.error(f"Cannot download product for {bulletin_id}: SSH client not initialized or connection inactive.")
-        return jsonify({"message": "Backend SSH client not initialized or connection inactive. Cannot download product.", "success": False}), 503
-
-    bulletin = next((b for b in BULLETINS if b["id"] == bulletin_id), None)
+    bulletin = BULLETINS_BY_ID.get(bulletin_id)
     if not bulletin:
         logging.warning(f"Download product request for unknown bulletin ID: {bulletin_id}")
         abort(404, description=f"Bulletin with ID '{bulletin_id}' not found.")
@@ -438,64 +989,101 @@ def download_bulletin_product(bulletin_id):
         logging.error(f"Failed to resolve dynamic product path for '{bulletin_id}' (template: {product_template}).")
         return jsonify({"message": f"Failed to resolve dynamic product path for '{bulletin_id}' (template: {product_template}).", "success": False}), 500
 
-    logging.debug(f"Download request for bulletin {bulletin_id}, product index {product_index}. Resolved remote path: '{remote_path}'")
+    logging.debug("Download request for bulletin %s, product index %s. Resolved remote path: '%s'", bulletin_id, product_index, remote_path)
 
     # --- NEW: Check if the file exists before attempting download ---
-    if not bqrm_ssh_client.file_exists(remote_path):
+    try:
+        with ssh_pool.acquire() as client:
+            file_size = client.get_file_size(remote_path)
+    except (SshPoolExhausted, SshConnectionLost):
+        raise
+    except Exception as e:
+        logging.error(f"Could not stat product {remote_path} for bulletin {bulletin_id}. Error: {e}")
+        return jsonify({"message": f"Error checking product file '{os.path.basename(remote_path)}' on remote server: {e}", "success": False}), 500
+    if file_size is None:
         logging.warning(f"Attempted to download non-existent product: {remote_path} for bulletin {bulletin_id}. File reported as not existing by SFTP.")
         return jsonify({"message": f"Product file '{os.path.basename(remote_path)}' not found on remote server for today's date. It might not have run yet or failed.", "success": False}), 404
 
-    # Create a temporary directory for downloads
-    temp_dir = "temp_downloads"
-    os.makedirs(temp_dir, exist_ok=True)
-
-    local_file_path, error_message = bqrm_ssh_client.download_file(remote_path, temp_dir)
-
-    if local_file_path:
-        filename = os.path.basename(local_file_path)
-        logging.info(f"Sending file '{local_file_path}' to client with filename '{filename}'.")
-        try:
-            response = send_file(local_file_path, as_attachment=True, download_name=filename)
-            @response.call_on_close
-            def cleanup_file():
-                try:
-                    os.remove(local_file_path)
-                    logging.info(f"Cleaned up temporary file: {local_file_path}")
-                except OSError as e:
-                    logging.error(f"Error cleaning up temporary file {local_file_path}: {e}")
-            return response
-        except Exception as e:
-            logging.error(f"Error sending file '{local_file_path}' to client: {e}")
-            if os.path.exists(local_file_path):
-                try:
-                    os.remove(local_file_path)
-                except OSError as e:
-                    logging.error(f"Error cleaning up failed-to-send file {local_file_path}: {e}")
-            return jsonify({"message": f"Failed to send product file: {e}", "success": False}), 500
-    else:
-        logging.error(f"Failed to download product file '{remote_path}' for '{bulletin_id}'. Error: {error_message}")
-        return jsonify({"message": f"Failed to download product file from remote server: {error_message}", "success": False}), 500
+    # Stream the file straight from SFTP to the client, without a local copy.
+    filename = os.path.basename(remote_path)
+    logging.info(f"Streaming '{remote_path}' ({file_size} bytes) to client with filename '{filename}'.")
+    return Response(
+        stream_with_context(ssh_pool.open_stream(remote_path)),
+        mimetype=mimetypes.guess_type(filename)[0] or "application/octet-stream",
+        headers={
+            "Content-Disposition": _attachment_disposition(filename),
+            "Content-Length": str(file_size),
+        },
+    )
+
+# --- Response Compression ---
+
+# JSON responses at least this large (e.g. a styled full log) are gzipped
+# for clients that accept it. Level 5 shrinks log text about 6x in roughly
+# 40 ms per 2 MB, where higher levels cost much more for little gain.
+GZIP_MIN_BYTES = 1024
+GZIP_COMPRESS_LEVEL = 5
+
+@app.after_request
+def compress_json_response(response):
+    if (
+        response.mimetype != "application/json"
+        or response.is_streamed
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or not request.accept_encodings["gzip"]
+    ):
+        return response
+    body = response.get_data()
+    if len(body) < GZIP_MIN_BYTES:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+def _gzip_stream(blocks):
+    """
+    Gzips a streamed response block by block. Each block is flushed with
+    Z_SYNC_FLUSH so the browser can decompress and render it on arrival.
+    """
+    compressor = zlib.compressobj(GZIP_COMPRESS_LEVEL, wbits=31)
+    for block in blocks:
+        yield compressor.compress(block.encode()) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
 
 # --- Error Handling for SSH Client Status ---
 
 @app.before_request
 def check_global_ssh_client_status():
+    # The only SSH check an API request gets: endpoints rely on it rather than
+    # repeating it, and is_healthy() only reads a flag kept by the pool.
     if request.path.startswith('/api'):
-        if bqrm_ssh_client is None:
-            logging.warning(f"API request to {request.path} received but SSH client was never initialized. Returning 503.")
+        # Per-request memo of remote product path -> exists.
+        g.exists_cache = {}
+        if ssh_pool is None:
+            logging.warning(f"API request to {request.path} received but SSH pool was never initialized. Returning 503.")
             return jsonify({"message": "Backend SSH client failed to initialize at startup. Please check server logs.", "status": "SYSTEM_ERROR"}), 503
-        elif not bqrm_ssh_client.is_active():
-            logging.warning(f"API request to {request.path} received but SSH client is not active. Attempting re-connection before returning 503.")
-            try:
-                bqrm_ssh_client._connect()
-                if bqrm_ssh_client.is_active():
-                    logging.info("SSH client re-connected successfully for API request.")
-                    return
-            except Exception as e:
-                logging.error(f"Failed to re-connect SSH client for API request: {e}")
+        if not ssh_pool.is_healthy():
+            # Leave the re-connection to the background thread and fail fast.
+            _reconnect_event.set()
+            logging.warning(f"API request to {request.path} received but no SSH connection is active. Returning 503.")
             return jsonify({"message": "Backend SSH client connection is currently inactive. Please check server logs.", "status": "SYSTEM_ERROR"}), 503
 
+@app.errorhandler(SshPoolExhausted)
+def handle_ssh_pool_exhausted(e):
+    logging.warning(f"API request to {request.path} timed out waiting for an SSH connection: {e} Returning 503.")
+    return jsonify({"message": "All backend SSH connections are busy. Please retry shortly.", "status": "SYSTEM_ERROR"}), 503
+
+@app.errorhandler(SshConnectionLost)
+def handle_ssh_connection_lost(e):
+    # Leave the re-connection to the background thread and fail fast.
+    _reconnect_event.set()
+    logging.warning(f"API request to {request.path} found no active SSH connection: {e} Returning 503.")
+    return jsonify({"message": "Backend SSH client connection is currently inactive. Please check server logs.", "status": "SYSTEM_ERROR"}), 503
+
 if __name__ == '__main__':
+    # Development server only; deploy with gunicorn (see wsgi.py). The
+    # debugger and reloader are enabled with FLASK_DEV=1.
     os.makedirs(app.static_folder, exist_ok=True)
-    os.makedirs("temp_downloads", exist_ok=True)
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(debug=bool(os.getenv('FLASK_DEV')), threaded=True, host='0.0.0.0', port=5000)
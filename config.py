@@ -1,4 +1,5 @@
 import os
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 load_dotenv() # This loads variables from your .env file into os.environ
@@ -8,11 +9,13 @@ BQRM_HOST = os.getenv("BQRM_HOST")
 BQRM_USER = os.getenv("BQRM_USER")
 BQRM_PRIVATE_KEY_PATH = os.getenv("BQRM_PRIVATE_KEY_PATH") # Path to your SSH private key
 BQRM_PASSWORD = os.getenv("BQRM_PASSWORD") # Only if not using a private key
+BQRM_SSH_COMPRESSION = os.getenv("BQRM_SSH_COMPRESSION", "1") != "0" # Set to 0 to disable on fast links
+BQRM_KNOWN_HOSTS_PATH = os.getenv("BQRM_KNOWN_HOSTS_PATH", "known_hosts_bqrm") # Where the server's host key is pinned on first connection
 
 LOG_LINES_TO_FETCH = 50
 # --- Bulletin Configurations ---
 # REPLACE THESE WITH YOUR ACTUAL BULLETIN DETAILS!
-BULLETINS = [
+_BULLETINS_RAW = [
     {
         "id": "sonelgaz",
         "name": "sonalgaz",
@@ -69,6 +72,16 @@ BULLETINS = [
       },
 ]
 
+# Frozen at import: request threads share the bulletin configs, and nothing
+# should modify them at runtime.
+BULLETINS = tuple(
+    MappingProxyType({**b, "product_paths": tuple(MappingProxyType(p) for p in b["product_paths"])})
+    for b in _BULLETINS_RAW
+)
+
+# Bulletins indexed by id, for O(1) lookups from the API endpoints.
+BULLETINS_BY_ID = MappingProxyType({b["id"]: b for b in BULLETINS})
+
 # --- Log Parsing Configuration ---
 SUCCESS_KEYWORDS = ["SUCCESS", "COMPLETED", "FINISHED"]
 ERROR_KEYWORDS = ["ERROR", "FAILURE", "FAILED", "EXCEPTION"]
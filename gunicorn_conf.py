@@ -0,0 +1,16 @@
+# gunicorn_conf.py
+
+import os
+
+bind = os.getenv("BULLETIN_MONITOR_BIND", "0.0.0.0:5000")
+
+# Threaded workers, so concurrent dashboard requests run in parallel and
+# share each worker's SSH connection pool.
+worker_class = "gthread"
+workers = 2
+threads = 8
+keepalive = 30
+
+# Every worker must import app.py itself, so it opens its own SSH pool:
+# paramiko transports cannot be shared across forked processes.
+preload_app = False
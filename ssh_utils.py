@@ -3,64 +3,242 @@
 import paramiko
 import os
 import logging
-import datetime
+import threading
+import queue
+import contextlib
+import functools
+import select
+import shlex
+import socket
+import uuid
 
-from config import BQRM_HOST, BQRM_USER, BQRM_PRIVATE_KEY_PATH, BQRM_PASSWORD, LOG_LINES_TO_FETCH
+from config import BQRM_HOST, BQRM_USER, BQRM_PRIVATE_KEY_PATH, BQRM_PASSWORD, BQRM_SSH_COMPRESSION, BQRM_KNOWN_HOSTS_PATH, LOG_LINES_TO_FETCH
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Flow-control window for the SFTP and shell channels. Paramiko's 2 MiB
+# default stalls pipelined SFTP reads on high-latency links.
+SSH_CHANNEL_WINDOW_SIZE = 16 * 1024 * 1024
+
+# Idle pooled connections send an SSH keepalive this often, so NAT and
+# firewall idle timeouts do not silently drop them. TCP keepalives on the
+# socket additionally detect a peer that has gone away.
+SSH_KEEPALIVE_SECONDS = 30
+TCP_KEEPALIVE_IDLE_SECONDS = 60
+TCP_KEEPALIVE_INTERVAL_SECONDS = 30
+
+# Bounds the TCP connect, SSH banner and authentication steps of a connection.
+SSH_CONNECT_TIMEOUT_SECONDS = 10
+
+# How long a request waits for a free pooled connection (or stream slot)
+# before giving up with SshPoolExhausted.
+POOL_ACQUIRE_TIMEOUT_SECONDS = 10
+
+_ASCII_WHITESPACE = b" \t\n\r\x0b\x0c"
+
+def _stripped_bytes(buffer, end):
+    """
+    Returns buffer[:end] as bytes without surrounding whitespace, like
+    bytes.strip(). The bytearray is trimmed in place first, so a large
+    command output is copied once rather than once per slice and strip.
+    """
+    while end and buffer[end - 1] in _ASCII_WHITESPACE:
+        end -= 1
+    del buffer[end:]
+    start = 0
+    while start < end and buffer[start] in _ASCII_WHITESPACE:
+        start += 1
+    del buffer[:start]
+    return bytes(buffer)
+
+@functools.lru_cache(maxsize=4)
+def _load_private_key(key_path, mtime):
+    """
+    Parses a private key file, once per path and modification time, so
+    re-connections skip decoding it again. Ed25519 and ECDSA keys are
+    accepted as well as RSA.
+    """
+    for key_class in (paramiko.RSAKey, paramiko.Ed25519Key, paramiko.ECDSAKey):
+        try:
+            return key_class.from_private_key_file(key_path)
+        except paramiko.PasswordRequiredException:
+            raise
+        except paramiko.SSHException:
+            continue
+    raise paramiko.SSHException(f"Unsupported or invalid private key file: {key_path}")
+
+def _enable_tcp_keepalive(sock):
+    """
+    Turns on TCP keepalives for the SSH socket, with shorter timings where
+    the platform allows setting them. Skipped for socket-like objects
+    (e.g. a proxy command) that do not support it.
+    """
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE_SECONDS)
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPALIVE_INTERVAL_SECONDS)
+    except (AttributeError, OSError) as e:
+        logging.warning(f"Could not enable TCP keepalive on the SSH socket: {e}")
+
+@functools.lru_cache(maxsize=1)
+def _system_host_keys():
+    """
+    Loads ~/.ssh/known_hosts once for the process instead of on every
+    (re)connection. A missing or unreadable file gives no keys, as with
+    SSHClient.load_system_host_keys().
+    """
+    host_keys = paramiko.HostKeys()
+    try:
+        host_keys.load(os.path.expanduser("~/.ssh/known_hosts"))
+    except IOError:
+        pass
+    return host_keys
+
+@functools.lru_cache(maxsize=1)
+def _pinned_host_keys():
+    """
+    Loads the host keys pinned in BQRM_KNOWN_HOSTS_PATH, once for the
+    process. Every client shares the returned HostKeys object.
+    """
+    host_keys = paramiko.HostKeys()
+    try:
+        host_keys.load(BQRM_KNOWN_HOSTS_PATH)
+    except IOError:
+        pass
+    return host_keys
+
+_pin_lock = threading.Lock()
+
+# Local directories download_file() has already created.
+_ensured_dirs = set()
+
+class _PinHostKeyPolicy(paramiko.MissingHostKeyPolicy):
+    """
+    Trusts a server's host key the first time it is seen, as AutoAddPolicy
+    did, but pins it in BQRM_KNOWN_HOSTS_PATH. Every later connection,
+    including after a restart, then rejects a different key.
+    """
+    def missing_host_key(self, client, hostname, key):
+        host_keys = _pinned_host_keys()
+        with _pin_lock:
+            if hostname in host_keys:
+                # Pinned by a concurrent first connection since this one started.
+                if host_keys[hostname].get(key.get_name()) == key:
+                    return
+                raise paramiko.SSHException(
+                    f"Host {hostname} offered a {key.get_name()} key that does not match the key pinned in {BQRM_KNOWN_HOSTS_PATH}."
+                )
+            host_keys.add(hostname, key.get_name(), key)
+            try:
+                host_keys.save(BQRM_KNOWN_HOSTS_PATH)
+            except IOError as e:
+                logging.warning(f"Could not save pinned host key to {BQRM_KNOWN_HOSTS_PATH}: {e}")
+        logging.warning(f"Pinned the {key.get_name()} host key of {hostname} (first connection).")
+
+class SshPoolExhausted(Exception):
+    """Raised when no pooled connection or stream slot frees up in time."""
+
+
+class SshConnectionLost(Exception):
+    """
+    Raised when no working SSH connection is available. Re-connecting is
+    left to BQRMSshPool.is_active(), off the request path.
+    """
+
+
 class BQRMSshClient:
     def __init__(self):
         self.client = None
+        # The client's transport, kept from connection time so is_active()
+        # does not look it up on every call.
+        self._transport = None
         self.sftp = None
+        # Long-lived remote shell that commands are fed to; see _execute_in_shell().
+        self._shell = None
+        # Commands each get their own channel on the shared transport, but
+        # (re)connecting, the single SFTP session and the shell channel must
+        # not be used from several threads at once.
+        self._connect_lock = threading.RLock()
+        self._sftp_lock = threading.Lock()
+        self._shell_lock = threading.Lock()
         self._connect()
 
     def _connect(self):
+        with self._connect_lock:
+            self._connect_unlocked()
+
+    def _connect_unlocked(self):
         try:
-            if self.client and self.client.get_transport() and self.client.get_transport().is_active():
-                logging.info(f"{datetime.datetime.now()} - SSH client already connected.")
+            if self.is_active():
+                logging.info("SSH client already connected.")
                 return
 
+            self._shell = None
+            self._transport = None
             self.client = paramiko.SSHClient()
-            self.client.load_system_host_keys()
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            # Equivalent to load_system_host_keys(), without re-reading the file.
+            self.client._system_host_keys = _system_host_keys()
+            self.client._host_keys = _pinned_host_keys()
+            self.client.set_missing_host_key_policy(_PinHostKeyPolicy())
 
             if BQRM_PRIVATE_KEY_PATH and os.path.exists(BQRM_PRIVATE_KEY_PATH):
-                private_key = paramiko.RSAKey.from_private_key_file(BQRM_PRIVATE_KEY_PATH)
-                self.client.connect(hostname=BQRM_HOST, username=BQRM_USER, pkey=private_key)
-                logging.info(f"{datetime.datetime.now()} - SSH connected to {BQRM_HOST} with private key.")
+                private_key = _load_private_key(BQRM_PRIVATE_KEY_PATH, os.stat(BQRM_PRIVATE_KEY_PATH).st_mtime)
+                self.client.connect(hostname=BQRM_HOST, username=BQRM_USER, pkey=private_key, compress=BQRM_SSH_COMPRESSION,
+                                    timeout=SSH_CONNECT_TIMEOUT_SECONDS, banner_timeout=SSH_CONNECT_TIMEOUT_SECONDS, auth_timeout=SSH_CONNECT_TIMEOUT_SECONDS)
+                logging.info(f"SSH connected to {BQRM_HOST} with private key.")
             elif BQRM_PASSWORD:
-                self.client.connect(hostname=BQRM_HOST, username=BQRM_USER, password=BQRM_PASSWORD)
-                logging.info(f"{datetime.datetime.now()} - SSH connected to {BQRM_HOST} with password.")
+                self.client.connect(hostname=BQRM_HOST, username=BQRM_USER, password=BQRM_PASSWORD, compress=BQRM_SSH_COMPRESSION,
+                                    timeout=SSH_CONNECT_TIMEOUT_SECONDS, banner_timeout=SSH_CONNECT_TIMEOUT_SECONDS, auth_timeout=SSH_CONNECT_TIMEOUT_SECONDS)
+                logging.info(f"SSH connected to {BQRM_HOST} with password.")
             else:
                 raise ValueError("Neither BQRM_PRIVATE_KEY_PATH nor BQRM_PASSWORD is set for SSH connection.")
             
+            self._transport = self.client.get_transport()
+            # Applies to every channel opened from here on.
+            self._transport.default_window_size = SSH_CHANNEL_WINDOW_SIZE
+            self._transport.set_keepalive(SSH_KEEPALIVE_SECONDS)
+            _enable_tcp_keepalive(self._transport.sock)
             self.sftp = self.client.open_sftp()
-            logging.info(f"{datetime.datetime.now()} - SFTP client opened.")
+            logging.info("SFTP client opened.")
 
         except Exception as e:
-            logging.error(f"{datetime.datetime.now()} - Failed to establish SSH connection: {e}")
+            logging.error(f"Failed to establish SSH connection: {e}")
             self.client = None
+            self._transport = None
             self.sftp = None
 
     def is_active(self):
-        return self.client is not None and self.client.get_transport() and self.client.get_transport().is_active()
+        return self._transport is not None and self._transport.is_active()
 
-    def execute_command(self, command, timeout=30):
+    def execute_command(self, command, timeout=30, decode=True, reuse_shell=True, idle_timeout=30):
+        """
+        Runs a command on the BQRM server and returns (success, output, error).
+        `timeout` limits opening the command's channel; `idle_timeout` limits
+        how long the running command may go without output, and None waits
+        for it to exit however long it stays quiet.
+        With decode=False the output is returned as raw bytes, for callers
+        that scan large outputs without needing them as text.
+        With reuse_shell=False the command always gets a channel of its own,
+        for long-running scripts that should neither hold the shared shell
+        nor leave background jobs writing to it.
+        Raises SshConnectionLost if the connection is down.
+        """
         if not self.is_active():
-            logging.warning("SSH client is not connected or connection is inactive. Attempting to re-connect.")
-            try:
-                self._connect()
-            except Exception as e:
-                logging.error(f"Failed to re-connect SSH: {e}")
-                return False, "", f"SSH connection inactive and failed to re-connect: {e}"
+            raise SshConnectionLost(f"SSH connection inactive, cannot execute '{command}'.")
 
         try:
             logging.info(f"Executing command on BQRM: '{command}'")
-            stdin, stdout, stderr = self.client.exec_command(command, timeout=timeout)
-            exit_status = stdout.channel.recv_exit_status()
-            output = stdout.read().decode().strip()
-            error = stderr.read().decode().strip()
+            result = self._execute_in_shell(command, idle_timeout) if reuse_shell else None
+            if result is None:
+                result = self._execute_in_channel(command, timeout, idle_timeout)
+            exit_status, output, error = result
+            # A no-op (no copy), as both paths already strip with _stripped_bytes.
+            output = output.strip()
+            if decode:
+                output = output.decode(errors="replace")
+            error = error.decode(errors="replace").strip()
 
             if exit_status != 0:
                 logging.error(f"Command '{command}' failed with exit status {exit_status}. Error: {error}")
@@ -75,6 +253,123 @@ class BQRMSshClient:
             logging.error(f"An unexpected error occurred during command execution for '{command}': {e}")
             return False, "", str(e)
 
+    def _execute_in_channel(self, command, timeout, idle_timeout):
+        """
+        Runs a command on a new channel of the transport, opened within
+        `timeout` seconds. See execute_command() for `idle_timeout`.
+        Returns (exit_status, stdout_bytes, stderr_bytes).
+        """
+        channel = self._transport.open_session(timeout=timeout)
+        try:
+            channel.exec_command(command)
+            stdout, stderr = bytearray(), bytearray()
+            # Drain both streams as data arrives: a command that fills the
+            # channel window on one of them would otherwise block.
+            # A dropped connection closes the channel without an EOF, so stop on either.
+            while not (channel.eof_received or channel.closed) or channel.recv_ready() or channel.recv_stderr_ready():
+                readable, _, _ = select.select([channel], [], [], idle_timeout)
+                if not readable:
+                    raise socket.timeout(f"No output from the remote command for {idle_timeout} seconds.")
+                while channel.recv_stderr_ready():
+                    stderr += channel.recv_stderr(32768)
+                while channel.recv_ready():
+                    chunk = channel.recv(32768)
+                    if not chunk:
+                        break
+                    stdout += chunk
+            if not channel.eof_received:
+                raise EOFError("SSH connection closed before the command finished.")
+            return channel.recv_exit_status(), _stripped_bytes(stdout, len(stdout)), _stripped_bytes(stderr, len(stderr))
+        finally:
+            channel.close()
+
+    def _execute_in_shell(self, command, idle_timeout):
+        """
+        Runs a command through the client's long-lived remote shell, which
+        saves opening (and the server setting up) a channel per command.
+        Each command runs in its own `$SHELL -c`, as with exec_command, and
+        its end is marked on stdout and stderr by a random sentinel line.
+        Returns (exit_status, stdout_bytes, stderr_bytes), or None if the
+        shell is busy or cannot be used, in which case the caller should
+        fall back to _execute_in_channel().
+        """
+        if not self._shell_lock.acquire(blocking=False):
+            return None
+        try:
+            marker = f"__BQRM_END_{uuid.uuid4().hex}__"
+            script = (
+                f"\"${{SHELL:-/bin/sh}}\" -c {shlex.quote(command)} </dev/null\n"
+                f"printf '\\n{marker} %d\\n' $?\n"
+                f"printf '\\n{marker}\\n' >&2\n"
+            )
+            try:
+                shell = self._get_shell()
+                # Drop anything a background job of an earlier command printed.
+                while shell.recv_ready():
+                    shell.recv(32768)
+                while shell.recv_stderr_ready():
+                    shell.recv_stderr(32768)
+                shell.sendall(script.encode())
+            except Exception as e:
+                logging.warning(f"Remote shell unavailable, using a new channel instead: {e}")
+                self._close_shell()
+                return None
+            try:
+                return self._read_shell_result(shell, marker.encode(), idle_timeout)
+            except Exception:
+                # The shell is out of step with its input now; start afresh next time.
+                self._close_shell()
+                raise
+        finally:
+            self._shell_lock.release()
+
+    def _get_shell(self):
+        if self._shell is None or self._shell.closed:
+            shell = self._transport.open_session()
+            shell.exec_command("/bin/sh")
+            self._shell = shell
+            logging.info("Remote shell channel opened.")
+        return self._shell
+
+    def _close_shell(self):
+        if self._shell is not None:
+            self._shell.close()
+            self._shell = None
+
+    @staticmethod
+    def _read_shell_result(shell, marker, idle_timeout):
+        stdout_end = b"\n" + marker + b" "
+        stderr_end = b"\n" + marker + b"\n"
+        stdout, stderr = bytearray(), bytearray()
+        stdout_at = stderr_at = -1
+        while stdout_at < 0 or stdout.find(b"\n", stdout_at + len(stdout_end)) < 0 or stderr_at < 0:
+            readable, _, _ = select.select([shell], [], [], idle_timeout)
+            if not readable:
+                raise socket.timeout(f"No output from the remote shell for {idle_timeout} seconds.")
+            received = False
+            while shell.recv_stderr_ready():
+                chunk = shell.recv_stderr(32768)
+                received = received or bool(chunk)
+                if stderr_at < 0:
+                    # Only the tail can complete a marker split across chunks.
+                    search_from = max(0, len(stderr) - len(stderr_end))
+                    stderr += chunk
+                    stderr_at = stderr.find(stderr_end, search_from)
+            while shell.recv_ready():
+                chunk = shell.recv(32768)
+                received = received or bool(chunk)
+                if not chunk:
+                    break
+                search_from = max(0, len(stdout) - len(stdout_end))
+                stdout += chunk
+                if stdout_at < 0:
+                    stdout_at = stdout.find(stdout_end, search_from)
+            if not received and (shell.eof_received or shell.closed):
+                raise EOFError("Remote shell closed before the command finished.")
+        status_end = stdout.find(b"\n", stdout_at + len(stdout_end))
+        exit_status = int(stdout[stdout_at + len(stdout_end):status_end])
+        return exit_status, _stripped_bytes(stdout, stdout_at), _stripped_bytes(stderr, stderr_at)
+
     def get_last_log_lines(self, log_path):
         command = f"tail -n {LOG_LINES_TO_FETCH} {log_path}"
         success, output, error = self.execute_command(command)
@@ -90,50 +385,302 @@ class BQRMSshClient:
         Returns True if exists, False otherwise (or on SSH error).
         """
         if not self.is_active():
-            logging.warning(f"{datetime.datetime.now()} - SSH client inactive, cannot check file existence for {remote_path}.")
+            logging.warning(f"SSH client inactive, cannot check file existence for {remote_path}.")
             return False
 
         try:
-            self.sftp.stat(remote_path)
+            with self._sftp_lock:
+                self.sftp.stat(remote_path)
             return True
         except FileNotFoundError:
             return False
         except Exception as e:
-            logging.error(f"{datetime.datetime.now()} - Error checking file existence for '{remote_path}': {e}")
+            logging.error(f"Error checking file existence for '{remote_path}': {e}")
             return False
 
+    def files_exist(self, remote_paths):
+        """
+        Checks several remote paths with a single command rather than one
+        SFTP round trip each. Returns a dict of remote_path -> bool, with
+        every path False if the check itself fails.
+        """
+        remote_paths = list(remote_paths)
+        if not remote_paths:
+            return {}
+        # One flag per path, in order, so odd file names cannot confuse the parsing.
+        command = (
+            f"for f in {' '.join(shlex.quote(p) for p in remote_paths)}; do "
+            f"if [ -e \"$f\" ]; then echo 1; else echo 0; fi; done"
+        )
+        success, output, error = self.execute_command(command)
+        flags = output.split()
+        if not success or len(flags) != len(remote_paths):
+            logging.warning(f"Could not check remote paths {remote_paths}. Error: {error}")
+            return dict.fromkeys(remote_paths, False)
+        return {p: flag == "1" for p, flag in zip(remote_paths, flags)}
+
+    def get_file_size(self, remote_path):
+        """
+        Returns the size in bytes of a remote file using SFTP, or None if it
+        does not exist. Other SFTP errors are raised, so callers do not take
+        them for a missing file.
+        """
+        if not self.is_active():
+            raise SshConnectionLost(f"SSH connection inactive, cannot stat {remote_path}.")
+
+        try:
+            with self._sftp_lock:
+                return self.sftp.stat(remote_path).st_size
+        except FileNotFoundError:
+            return None
+
+    def read_tail(self, remote_path, max_bytes):
+        """
+        Reads at most the last `max_bytes` bytes of a remote file using SFTP,
+        without spawning a remote shell.
+        Returns (content, truncated, error): the raw bytes, whether the file
+        was longer than `max_bytes`, and an error message or None.
+        """
+        if not self.is_active():
+            logging.warning(f"SSH client inactive, cannot read {remote_path}.")
+            return None, False, "SSH connection inactive."
+
+        try:
+            with self._sftp_lock:
+                with self.sftp.open(remote_path, 'rb') as remote_file:
+                    file_size = remote_file.stat().st_size
+                    offset = max(0, file_size - max_bytes)
+                    remote_file.seek(offset)
+                    # Pipeline the reads rather than waiting on each request in turn.
+                    remote_file.prefetch(file_size)
+                    content = remote_file.read(file_size - offset)
+            return content, offset > 0, None
+        except FileNotFoundError:
+            logging.error(f"Remote file not found: {remote_path}")
+            return None, False, f"Remote file not found: {remote_path}"
+        except Exception as e:
+            logging.error(f"Error reading file '{remote_path}': {e}")
+            return None, False, str(e)
+
+    def download_file_stream(self, remote_path, chunk_size=1 << 20, offset=0):
+        """
+        Yields the content of a remote file in chunks, starting at `offset`,
+        read over a dedicated SFTP session so the transfer neither touches
+        local disk nor blocks other SFTP calls on the shared session.
+        """
+        if not self.is_active():
+            logging.warning(f"SSH client inactive, cannot stream {remote_path}.")
+            return
+
+        sftp = None
+        try:
+            # Opened inside the try: the connection can still drop meanwhile.
+            sftp = self.client.open_sftp()
+            with sftp.open(remote_path, 'rb') as remote_file:
+                file_size = remote_file.stat().st_size
+                if offset:
+                    remote_file.seek(offset)
+                # Keep the reads pipelined rather than waiting a round trip
+                # for each 32 KiB request.
+                remote_file.prefetch(file_size)
+                while True:
+                    chunk = remote_file.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+            logging.info(f"Successfully streamed '{remote_path}'")
+        except Exception as e:
+            logging.error(f"Error streaming file '{remote_path}': {e}")
+        finally:
+            if sftp is not None:
+                sftp.close()
+
     def download_file(self, remote_path, local_temp_dir="temp_downloads"):
         if not self.is_active():
-            self._connect()
-            if not self.is_active():
-                logging.error(f"{datetime.datetime.now()} - Failed to download {remote_path}: SSH connection inactive.")
-                return None, "SSH connection inactive."
+            raise SshConnectionLost(f"SSH connection inactive, cannot download {remote_path}.")
 
         try:
-            os.makedirs(local_temp_dir, exist_ok=True)
+            if local_temp_dir not in _ensured_dirs:
+                os.makedirs(local_temp_dir, exist_ok=True)
+                _ensured_dirs.add(local_temp_dir)
             filename = os.path.basename(remote_path)
             local_path = os.path.join(local_temp_dir, filename)
             
-            logging.info(f"{datetime.datetime.now()} - Attempting to download remote file '{remote_path}' to local '{local_path}'")
-            self.sftp.get(remote_path, local_path)
-            logging.info(f"{datetime.datetime.now()} - Successfully downloaded '{remote_path}'")
+            logging.info(f"Attempting to download remote file '{remote_path}' to local '{local_path}'")
+            with self._sftp_lock:
+                self.sftp.get(remote_path, local_path)
+            logging.info(f"Successfully downloaded '{remote_path}'")
             return local_path, None
         except FileNotFoundError:
-            logging.error(f"{datetime.datetime.now()} - Remote file not found: {remote_path}")
+            # Could also be the local directory, removed since it was created.
+            _ensured_dirs.discard(local_temp_dir)
+            logging.error(f"Remote file not found: {remote_path}")
             return None, f"Remote file not found: {remote_path}"
         except Exception as e:
-            logging.error(f"{datetime.datetime.now()} - Error downloading file '{remote_path}': {e}")
+            logging.error(f"Error downloading file '{remote_path}': {e}")
             return None, str(e)
 
     def close(self):
-        if self.client and self.client.get_transport() and self.client.get_transport().is_active():
+        self._close_shell()
+        if self.is_active():
             self.client.close()
-            # Removed _is_connected as it's not a class member, rely on get_transport().is_active()
+            # Removed _is_connected as it's not a class member, rely on is_active()
             logging.info("SSH connection to BQRM closed.")
         else:
             logging.info("SSH client was not active or already closed.")
+        self._transport = None
+
+class BQRMSshPool:
+    """
+    A small pool of persistent BQRMSshClient connections. Callers check a
+    client out for the duration of their SSH work:
+
+        with pool.acquire() as client:
+            client.execute_command(...)
+
+    so concurrent requests run on separate transports, and a dropped
+    connection only affects the requests using it. Connections are opened
+    lazily, up to `size`. Dead ones are dropped on checkout and on release;
+    once none works, acquire() raises SshConnectionLost and re-connecting is
+    left to is_active(), called from a background thread.
+
+    File transfers paced by a HTTP client go through open_stream() instead,
+    which holds a connection only while the transfer starts and counts it
+    against a separate budget of `stream_size` concurrent streams.
+    """
+    def __init__(self, size, stream_size):
+        self.size = size
+        self._idle_clients = queue.LifoQueue()
+        # Bounds the number of checked-out clients, and so of open connections.
+        self._slots = threading.BoundedSemaphore(size)
+        self._stream_slots = threading.BoundedSemaphore(stream_size)
+        # Open one connection up front so startup reports whether SSH works.
+        initial_client = BQRMSshClient()
+        self._idle_clients.put(initial_client)
+        # Whether the last released client was connected; see is_healthy().
+        self._healthy = initial_client.is_active()
+
+    def _checkout(self, reconnect=False):
+        """
+        Returns a working idle client, dropping dead ones on the way, or opens
+        a new connection if none was idle. Unless `reconnect` is set, raises
+        SshConnectionLost instead of connecting again once connections failed.
+        """
+        while True:
+            try:
+                client = self._idle_clients.get_nowait()
+            except queue.Empty:
+                break
+            if self._health_check(client):
+                return client
+            logging.warning("Dropping an inactive pooled SSH connection.")
+            client.close()
+            self._healthy = False
+        if not (self._healthy or reconnect):
+            raise SshConnectionLost("No pooled SSH connection is active.")
+        logging.info(f"Opening a new SSH connection for the pool (size {self.size}).")
+        client = BQRMSshClient()
+        if not (client.is_active() or reconnect):
+            self._healthy = False
+            raise SshConnectionLost("Could not open a new pooled SSH connection.")
+        return client
+
+    def _release(self, client):
+        self._healthy = client.is_active()
+        if self._healthy:
+            self._idle_clients.put(client)
+        else:
+            client.close()
+
+    @staticmethod
+    def _health_check(client):
+        """
+        Returns whether a pooled client's connection still works. Sending an
+        SSH ignore message costs no round trip, but fails on a socket the
+        server has dropped while the transport still reports itself active.
+        """
+        if not client.is_active():
+            return False
+        try:
+            client._transport.send_ignore()
+            return True
+        except Exception as e:
+            logging.warning(f"Pooled SSH connection failed its health check: {e}")
+            return False
+
+    @contextlib.contextmanager
+    def acquire(self, timeout=POOL_ACQUIRE_TIMEOUT_SECONDS):
+        if not self._slots.acquire(timeout=timeout):
+            raise SshPoolExhausted(f"No pooled SSH connection became free within {timeout}s.")
+        client = None
+        try:
+            client = self._checkout()
+            yield client
+        finally:
+            if client is not None:
+                self._release(client)
+            self._slots.release()
+
+    def open_stream(self, remote_path, chunk_size=1 << 20, offset=0, timeout=POOL_ACQUIRE_TIMEOUT_SECONDS):
+        """
+        Returns an iterator over a remote file's content, as
+        BQRMSshClient.download_file_stream() yields it. The stream slot is
+        claimed and the first chunk fetched before this returns, so
+        SshPoolExhausted is raised here rather than midway through a response.
+        """
+        stream = self._stream(remote_path, chunk_size, offset, timeout)
+        next(stream)
+        return stream
+
+    def _stream(self, remote_path, chunk_size, offset, timeout):
+        if not self._stream_slots.acquire(timeout=timeout):
+            raise SshPoolExhausted(f"No SSH stream slot became free within {timeout}s.")
+        chunks = None
+        try:
+            # The transfer runs on its own SFTP channel, so the connection
+            # goes back to the pool as soon as that channel is open.
+            with self.acquire(timeout) as client:
+                chunks = client.download_file_stream(remote_path, chunk_size, offset)
+                first_chunk = next(chunks, None)
+            yield None
+            if first_chunk is not None:
+                yield first_chunk
+                yield from chunks
+        finally:
+            if chunks is not None:
+                chunks.close()
+            self._stream_slots.release()
+
+    def is_healthy(self):
+        """
+        Returns whether the pool's connections last worked.
+        Unlike is_active(), this never blocks or re-connects.
+        """
+        return self._healthy
+
+    def is_active(self):
+        """
+        Returns True if the pool can hand out a connected client,
+        re-connecting one if needed.
+        """
+        if not self._slots.acquire(timeout=POOL_ACQUIRE_TIMEOUT_SECONDS):
+            raise SshPoolExhausted(f"No pooled SSH connection became free within {POOL_ACQUIRE_TIMEOUT_SECONDS}s.")
+        try:
+            client = self._checkout(reconnect=True)
+            self._release(client)
+            return client.is_active()
+        finally:
+            self._slots.release()
+
+    def close(self):
+        while True:
+            try:
+                client = self._idle_clients.get_nowait()
+            except queue.Empty:
+                break
+            client.close()
 
-# No global bqrm_ssh_client instance here. It will be managed in app.py.
+# No global pool instance here. It will be managed in app.py.
 
 # --- Self-Test for ssh_utils.py (Run this file directly to test SSH) ---
 if __name__ == "__main__":
@@ -14,8 +14,10 @@ document.addEventListener('DOMContentLoaded', () => {
     const exportCriticalButton = document.getElementById('exportCriticalButton');
 
     const API_BASE_URL = '/api';
+    const bulletinNames = {}; // Bulletin id -> display name, filled as cards render
 
-    // Function to fetch and display bulletin statuses (summary)
+    // Function to fetch and display bulletin statuses (summary).
+    // Statuses are streamed as NDJSON so each card appears as soon as it is ready.
     async function fetchBulletinsStatus() {
         refreshButton.disabled = true;
         refreshButton.classList.add('loading');
@@ -24,13 +26,37 @@ document.addEventListener('DOMContentLoaded', () => {
 
         bulletinsContainer.innerHTML = '<div class="loading-message">Loading bulletin statuses...</div>';
         try {
-            const response = await fetch(`${API_BASE_URL}/bulletins`);
+            const response = await fetch(`${API_BASE_URL}/bulletins/stream`);
             if (!response.ok) {
                 const errorData = await response.json();
                 throw new Error(errorData.message || `HTTP error! status: ${response.status}`);
             }
-            const bulletins = await response.json();
-            renderBulletins(bulletins);
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffered = '';
+            let renderedCount = 0;
+            const renderLine = (line) => {
+                if (!line.trim()) return;
+                if (renderedCount === 0) {
+                    bulletinsContainer.innerHTML = ''; // Clear the loading message
+                }
+                renderBulletinCard(JSON.parse(line));
+                renderedCount++;
+            };
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffered += decoder.decode(value, { stream: true });
+                const lines = buffered.split('\n');
+                buffered = lines.pop(); // Keep any incomplete line for the next chunk
+                lines.forEach(renderLine);
+            }
+            renderLine(buffered + decoder.decode());
+
+            if (renderedCount === 0) {
+                bulletinsContainer.innerHTML = '<div class="loading-message">No bulletins configured or found.</div>';
+            }
             updateLastUpdated();
         } catch (error) {
             console.error("Error fetching bulletin statuses:", error);
@@ -43,54 +69,50 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
-    // Function to render bulletin cards
-    function renderBulletins(bulletins) {
-        bulletinsContainer.innerHTML = ''; // Clear previous content
-        if (bulletins.length === 0) {
-            bulletinsContainer.innerHTML = '<div class="loading-message">No bulletins configured or found.</div>';
-            return;
-        }
+    // Function to render one bulletin card, keeping cards in configuration order
+    function renderBulletinCard(bulletin) {
+        const card = document.createElement('div');
+        card.className = 'bulletin-card';
+        card.dataset.index = bulletin.index;
+        bulletinNames[bulletin.id] = bulletin.name;
 
-        bulletins.forEach(bulletin => {
-            const card = document.createElement('div');
-            card.className = 'bulletin-card';
-
-            const warningBadge = bulletin.has_warnings ?
-                '<span class="warning-badge" title="Warnings found in log">&#9888;</span>' : '';
-            
-            card.innerHTML = `
-                <h2>${bulletin.name}</h2>
-                <div class="bulletin-info">
-                    <p>Status: <span class="status-indicator status-${bulletin.status}">${bulletin.status}</span>${warningBadge}</p>
-                    <p>Last Run: <strong>${bulletin.last_run}</strong></p>
-                </div>
-                <div class="bulletin-actions" id="actions-${bulletin.id}">
-                    <button class="rerun-button" data-id="${bulletin.id}">Rerun</button>
-                    <button class="view-log-button" data-id="${bulletin.id}">View Log</button>
-                    <!-- Download Product Buttons will be added dynamically here -->
-                </div>
-            `;
-            bulletinsContainer.appendChild(card);
-
-            const actionsDiv = card.querySelector(`#actions-${bulletin.id}`);
-            // NEW: bulletin.product_info now contains availability
-            if (bulletin.product_info && bulletin.product_info.length > 0) {
-                bulletin.product_info.forEach((product_details, index) => { // Iterate over product_info
-                    const downloadButton = document.createElement('button');
-                    downloadButton.className = 'download-product-button';
-                    downloadButton.dataset.id = bulletin.id;
-                    downloadButton.dataset.productIndex = index; // Store the index
-                    downloadButton.textContent = product_details.name || `Download Product ${index + 1}`;
-                    
-                    // Disable button if product is not available
-                    if (!product_details.available) {
-                        downloadButton.disabled = true;
-                        downloadButton.title = `Product "${product_details.name}" not available for today.`;
-                    }
-                    actionsDiv.appendChild(downloadButton);
-                });
-            }
-        });
+        const warningBadge = bulletin.has_warnings ?
+            '<span class="warning-badge" title="Warnings found in log">&#9888;</span>' : '';
+        
+        card.innerHTML = `
+            <h2>${bulletin.name}</h2>
+            <div class="bulletin-info">
+                <p>Status: <span class="status-indicator status-${bulletin.status}">${bulletin.status}</span>${warningBadge}</p>
+                <p>Last Run: <strong>${bulletin.last_run}</strong></p>
+            </div>
+            <div class="bulletin-actions" id="actions-${bulletin.id}">
+                <button class="rerun-button" data-id="${bulletin.id}">Rerun</button>
+                <button class="view-log-button" data-id="${bulletin.id}">View Log</button>
+                <!-- Download Product Buttons will be added dynamically here -->
+            </div>
+        `;
+        const nextCard = Array.from(bulletinsContainer.children)
+            .find(el => Number(el.dataset.index) > bulletin.index);
+        bulletinsContainer.insertBefore(card, nextCard || null);
+
+        const actionsDiv = card.querySelector(`#actions-${bulletin.id}`);
+        // NEW: bulletin.product_info now contains availability
+        if (bulletin.product_info && bulletin.product_info.length > 0) {
+            bulletin.product_info.forEach((product_details, index) => { // Iterate over product_info
+                const downloadButton = document.createElement('button');
+                downloadButton.className = 'download-product-button';
+                downloadButton.dataset.id = bulletin.id;
+                downloadButton.dataset.productIndex = index; // Store the index
+                downloadButton.textContent = product_details.name || `Download Product ${index + 1}`;
+                
+                // Disable button if product is not available
+                if (!product_details.available) {
+                    downloadButton.disabled = true;
+                    downloadButton.title = `Product "${product_details.name}" not available for today.`;
+                }
+                actionsDiv.appendChild(downloadButton);
+            });
+        }
     }
 
     // Function to handle bulletin re-run
@@ -148,17 +170,47 @@ document.addEventListener('DOMContentLoaded', () => {
         }
 
         try {
-            const response = await fetch(`${API_BASE_URL}/bulletins/${bulletinId}/full_log`);
+            // The styled log is streamed as HTML fragments and rendered as it arrives.
+            const response = await fetch(`${API_BASE_URL}/bulletins/${bulletinId}/full_log/stream`);
             if (!response.ok) {
                 const errorData = await response.json();
                 throw new Error(errorData.message || `HTTP error! status: ${response.status}`);
             }
-            const data = await response.json();
 
-            modalBulletinName.textContent = data.name;
-            modalLogContent.innerHTML = data.full_log || 'No log content available.';
-            
-            modalLogContent.dataset.styledLogHtml = data.full_log; 
+            modalBulletinName.textContent = bulletinNames[bulletinId] || bulletinId;
+            modalLogContent.dataset.styledLogHtml = '';
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffered = '';
+            let styledLogHtml = '';
+            const appendHtml = (html) => {
+                if (!styledLogHtml) {
+                    modalLogContent.innerHTML = ''; // Clear the loading message
+                }
+                modalLogContent.insertAdjacentHTML('beforeend', html);
+                styledLogHtml += html;
+            };
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffered += decoder.decode(value, { stream: true });
+                // Styled lines never contain a newline, so everything up to
+                // the last one is a run of complete elements.
+                const cut = buffered.lastIndexOf('\n') + 1;
+                if (cut > 0) {
+                    appendHtml(buffered.slice(0, cut));
+                    buffered = buffered.slice(cut);
+                }
+            }
+            buffered += decoder.decode();
+            if (buffered) {
+                appendHtml(buffered);
+            }
+
+            if (!styledLogHtml) {
+                modalLogContent.innerHTML = 'No log content available.';
+            }
+            modalLogContent.dataset.styledLogHtml = styledLogHtml;
 
         } catch (error) {
             console.error("Error fetching full log:", error);
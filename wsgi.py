@@ -0,0 +1,11 @@
+# wsgi.py
+#
+# Production entry point. Run with gunicorn, using the settings in
+# gunicorn_conf.py:
+#
+#     gunicorn -c gunicorn_conf.py wsgi:application
+#
+# For local development, `FLASK_DEV=1 python app.py` still starts the
+# Werkzeug server with the debugger and reloader.
+
+from app import app as application